@@ -34,6 +34,10 @@ def pytest_addoption(parser):
         '--not_relaxed',
         action='store_true',
         help='whether to not use relaxed_locate for tests')
+    parser.addoption(
+        '--reuse_pages',
+        action='store_true',
+        help='whether to skip reloading a page that a previous test left untouched')
 
 
 def pytest_collection_modifyitems(session, config, items):
@@ -96,14 +100,54 @@ def browser(request, browser_manager):
         browser_manager.quit()
 
 
+PAGE_TRACKER = """
+window.__nerodiaPageDirty = false;
+var dirty = function() { window.__nerodiaPageDirty = true; };
+new MutationObserver(dirty).observe(document, {attributes: true, characterData: true,
+                                               childList: true, subtree: true});
+['change', 'click', 'focusin', 'input', 'keydown', 'scroll', 'submit'].forEach(function(e) {
+    document.addEventListener(e, dirty, true);
+});
+"""
+
+# null when the tracker is missing, e.g. after a refresh, so that page counts as dirty
+PAGE_DIRTY = """
+return typeof window.__nerodiaPageDirty == 'undefined' ? null : window.__nerodiaPageDirty;
+"""
+
+
 @pytest.fixture(scope='session')
-def page(browser_manager, webserver):
+def page(request, browser_manager, webserver):
+    reuse_pages = request.config.getoption('--reuse_pages')
+
     class Page(object):
+        loaded = None  # (browser, window handle, url) of the last tracked page load
+
         def url(self, name):
             return webserver.path_for(name)
 
         def load(self, name):
-            browser_manager.browser.goto(self.url(name))
+            url = self.url(name)
+            browser = browser_manager.browser
+            if reuse_pages and self._untouched(browser, url):
+                return
+            browser.goto(url)
+            if reuse_pages:
+                browser.execute_script(PAGE_TRACKER)
+                self.loaded = (browser, browser.driver.current_window_handle, url)
+
+        def _untouched(self, browser, url):
+            if self.loaded is None:
+                return False
+            loaded_browser, handle, loaded_url = self.loaded
+            if loaded_browser is not browser or loaded_url != url:
+                return False
+            try:
+                browser.locate()
+                return browser.driver.current_window_handle == handle and browser.url == url and \
+                    browser.execute_script(PAGE_DIRTY) is False
+            except Exception:
+                return False
     return Page()
 
 
@@ -125,8 +169,13 @@ def quick_timeout():
 
 
 @pytest.fixture
-def timeout_reset():
+def timeout_reset(request):
+    """
+    Restores nerodia.default_timeout after the test
+    Parametrize indirectly to set the timeout used by the test
+    """
     original = nerodia.default_timeout
+    nerodia.default_timeout = getattr(request, 'param', original)
     yield
     nerodia.default_timeout = original
 
@@ -15,6 +15,20 @@ tag_to_class = ttc or {}
 
 relaxed_locate = True
 
+#
+# Whether or not relaxed locating should skip looking for an element again when the DOM has not
+# changed since the previous attempt. Defaults to false.
+#
+
+mutation_aware_locate = False
+
+#
+# Time in seconds to remember that waiting for an element timed out. While remembered, waiting for
+# the same element on the same page raises after a single attempt. Defaults to None (disabled).
+#
+
+negative_locate_cache_ttl = None
+
 #
 # Default wait time for wait methods.
 #
@@ -52,6 +52,7 @@ class Browser(Container, HasWindow, Waitable, Scrolling):
         self.default_context = True
         self._original_window = None
         self._locator_namespace = locators
+        self._missing_elements = {}
 
     @property
     def locator_namespace(self):
@@ -9,6 +9,9 @@ from nerodia.exception import LocatorException
 from nerodia.js_snippet import JSSnippet
 from .locators.class_helpers import ClassHelpers
 
+# element class resolved for each collection class
+_element_classes = {}
+
 
 class ElementCollection(ClassHelpers, JSSnippet):
 
@@ -40,9 +43,6 @@ class ElementCollection(ClassHelpers, JSSnippet):
         from .elements.input import Input
         dic = {}
         for idx, (el, tag_name) in enumerate(self._elements_with_tags):
-            selector = self.selector.copy()
-            if idx != 0:
-                selector['index'] = idx
             selector = dict(self.selector, index=idx)
             element = self._element_class(self.query_scope, selector)
             if element.__class__ in [HTMLElement, Input]:
@@ -199,6 +199,12 @@ class ElementCollection(ClassHelpers, JSSnippet):
 
     @property
     def _element_class(self):
+        klass = _element_classes.get(self.__class__)
+        if klass is None:
+            klass = _element_classes[self.__class__] = self._resolve_element_class()
+        return klass
+
+    def _resolve_element_class(self):
         from .elements.svg_elements import SVGElementCollection
         from .elements.html_elements import HTMLElementCollection
         from .module_mapping import map_module
@@ -1,10 +1,11 @@
-from inspect import getmembers, isroutine, stack
-from re import search, sub
+from inspect import currentframe, getmembers, isroutine
+from re import search
 
 import six
 from selenium.common.exceptions import ElementNotInteractableException, \
     ElementNotVisibleException, \
-    InvalidElementStateException, NoSuchWindowException, StaleElementReferenceException
+    InvalidElementStateException, NoSuchWindowException, StaleElementReferenceException, \
+    WebDriverException
 from selenium.webdriver.common.action_chains import ActionChains
 
 import nerodia
@@ -19,18 +20,20 @@ from nerodia.js_snippet import JSSnippet
 from nerodia.locators.class_helpers import ClassHelpers
 from nerodia.locators.element.selector_builder import SelectorBuilder
 from nerodia.user_editable import UserEditable
+from nerodia.wait.timer import Timer, monotonic
 from nerodia.wait.wait import TimeoutError, Wait, Waitable
 from nerodia.window import Dimension, Point
 
 
 class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacent, Scrolling):
-    ATTRIBUTES = []
+    ATTRIBUTES = frozenset()
     keyword = None
 
     _content_editable = None
     _selector_builder = None
     _element_matcher = None
     _locator = None
+    _tag_name = None
 
     def __init__(self, query_scope, selector):
         self.query_scope = query_scope
@@ -60,24 +63,26 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
                                          reference='http://watir.com/staleness-changes',
                                          ids=['stale_exists'])
                 return False
-            self.assert_exists()
-            return True
+            # same as assert_exists, without building an error message for a missing element
+            if not self._located:
+                self.locate()
+            return self._located
         except (UnknownObjectException, UnknownFrameException):
             return False
 
     exist = exists
 
     def __repr__(self):
-        string = '#<{}: '.format(self.__class__.__name__)
+        parts = ['#<', self.__class__.__name__, ': ']
         if self.keyword:
-            string += 'keyword: {} '.format(self.keyword)
-        string += 'located: {}; '.format(self._located)
+            parts.extend(['keyword: ', str(self.keyword), ' '])
+        parts.extend(['located: ', str(self._located), '; '])
         if not self.selector:
-            string += '{element: (selenium element)}'
+            parts.append('{element: (selenium element)}')
         else:
-            string += self.selector_string
-        string += '>'
-        return string
+            parts.append(self.selector_string)
+        parts.append('>')
+        return ''.join(parts)
 
     def __eq__(self, other):
         """
@@ -106,7 +111,11 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
         Returns the tag name of the element
         :rtype: str
         """
-        return self._element_call(lambda: self.el.tag_name).lower()
+        # the tag name of a DOM element never changes, so keep it as long as el is unchanged
+        if self._tag_name is None or self._tag_name[0] is not self.el:
+            name = self._element_call(lambda: self.el.tag_name).lower()
+            self._tag_name = (self.el, name)
+        return self._tag_name[1]
 
     def click(self, *modifiers):
         """
@@ -128,19 +137,18 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
         browser.element(name='new_user_button').click(Keys.SHIFT, Keys.CONTROL)
         """
 
-        def method():
-            if modifiers:
-                action = ActionChains(self.driver)
-                for mod in modifiers:
-                    action.key_down(mod)
-                action.click(self.el)
-                for mod in modifiers:
-                    action.key_up(mod)
-                action.perform()
-            else:
-                self.el.click()
+        def chain(action):
+            for mod in modifiers:
+                action.key_down(mod)
+            action.click(self.el)
+            for mod in modifiers:
+                action.key_up(mod)
+            return action
 
-        self._element_call(method, self.wait_for_enabled)
+        if modifiers:
+            self._perform_actions(chain, self.wait_for_enabled)
+        else:
+            self._element_call(lambda: self.el.click(), self.wait_for_enabled)
         self.browser.after_hooks.run()
 
     def js_click(self):
@@ -162,8 +170,7 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
 
         browser.element(name='new_user_button').double_click()
         """
-        self._element_call(lambda: ActionChains(self.driver).double_click(self.el)
-                           .perform(), self.wait_for_present)
+        self._perform_actions(lambda action: action.double_click(self.el))
         self.browser.after_hooks.run()
 
     def js_double_click(self):
@@ -185,8 +192,7 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
 
         browser.element(name='new_user_button').right_click()
         """
-        self._element_call(lambda: ActionChains(self.driver).context_click(self.el)
-                           .perform(), self.wait_for_present)
+        self._perform_actions(lambda action: action.context_click(self.el))
         self.browser.after_hooks.run()
 
     def hover(self):
@@ -198,8 +204,7 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
 
         browser.element(name='new_user_button').hover()
         """
-        self._element_call(lambda: ActionChains(self.driver).move_to_element(self.el)
-                           .perform(), self.wait_for_present)
+        self._perform_actions(lambda action: action.move_to_element(self.el))
         self.browser.after_hooks.run()
 
     def drag_and_drop_on(self, other):
@@ -217,9 +222,7 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
         """
         self._assert_is_element(other)
 
-        value = self._element_call(lambda: ActionChains(self.driver)
-                                   .drag_and_drop(self.el, other.wd).perform(),
-                                   self.wait_for_present)
+        value = self._perform_actions(lambda action: action.drag_and_drop(self.el, other.wd))
         self.browser.after_hooks.run()
         return value
 
@@ -235,9 +238,8 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
 
         browser.div(id='draggable').drag_and_drop_by(100, -200)
         """
-        self._element_call(lambda: ActionChains(self.driver).
-                           drag_and_drop_by_offset(self.el, xoffset, yoffset).perform(),
-                           self.wait_for_present)
+        self._perform_actions(
+            lambda action: action.drag_and_drop_by_offset(self.el, xoffset, yoffset))
 
     def select_text(self, string):
         """
@@ -340,7 +342,10 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
         browser.button(name='new_user_button').fire_event('mousemove')
         browser.button(name='new_user_button').fire_event('onmouseover')
         """
-        event_name = sub(r'^on', '', str(event_name)).lower()
+        event_name = str(event_name)
+        if event_name.startswith('on'):
+            event_name = event_name[2:]
+        event_name = event_name.lower()
 
         self._element_call(lambda: self._execute_js('fireEvent', self.el, event_name))
 
@@ -522,7 +527,9 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
 
         browser.element(xpath="//input[@type='submit']").to_subtype()  #=> #<Button>
         """
-        tag = self.tag_name
+        tag, elem_type = self._element_call(lambda: self.driver.execute_script(
+            'return [arguments[0].tagName.toLowerCase(), arguments[0].type];', self.el))
+        self._tag_name = (self.el, tag)
         from .button import Button
         from .check_box import CheckBox
         from .file_field import FileField
@@ -531,7 +538,6 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
         from .text_field import TextField
 
         if tag == 'input':
-            elem_type = self.attribute_value('type')
             if elem_type in Button.VALID_TYPES:
                 klass = Button
             elif elem_type == 'checkbox':
@@ -571,13 +577,16 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
     @property
     def stale_in_context(self):
         try:
-            self.el.value_of_css_property('staleness_check')  # any wire call checks for staleness
-            return False
+            # any wire call checks for staleness; isConnected also catches detached elements on
+            # drivers that still accept them, without forcing a style recalculation
+            connected = self.driver.execute_script('return arguments[0].isConnected;', self.el)
+            return connected is False
         except StaleElementReferenceException:
             return True
 
     def reset(self):
         self.el = None
+        self._tag_name = None
 
     def locate(self):
         self._ensure_context()
@@ -600,7 +609,6 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
 
     @property
     def selector_string(self):
-        from ..browser import Browser
         if isinstance(self.query_scope, Browser):
             return repr(self.selector)
         else:
@@ -612,11 +620,23 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
         if self._located:  # Performance shortcut
             return None
 
+        missing_key = self._missing_key if nerodia.negative_locate_cache_ttl else None
         try:
             if not isinstance(self.query_scope, Browser):
                 self.query_scope.wait_for_exists()
-            self.wait_until(lambda e: e.exists, element_reset=True)
+            if self._recently_missing(missing_key) and not self.exists:
+                raise self._unknown_exception(
+                    '{} not located; timed out within the last {} seconds'.format(
+                        self, nerodia.negative_locate_cache_ttl))
+            counts_mutations = self._counts_mutations
+            check = self._mutation_aware_check if counts_mutations else (lambda e: e.exists)
+            try:
+                self.wait_until(check, element_reset=True)
+            finally:
+                if counts_mutations:
+                    self._stop_counting_mutations()
         except TimeoutError:
+            self._remember_missing(missing_key)
             raise self._unknown_exception('timed out after {} seconds, waiting for {} to be '
                                           'located'.format(nerodia.default_timeout, self))
 
@@ -653,16 +673,19 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
             self._raise_disabled()
 
     def wait_for_writable(self):
+        has_readonly = hasattr(type(self), 'readonly')
+        if nerodia.relaxed_locate and has_readonly and self._writable:
+            return
         self.wait_for_enabled()
         if not nerodia.relaxed_locate:
-            if hasattr(self, 'readonly') and self.readonly:
+            if has_readonly and self.readonly:
                 self._raise_writable()
 
-        if not hasattr(self, 'readonly') or not self.readonly:
+        if not has_readonly or not self.readonly:
             return
 
         try:
-            self.wait_until(lambda e: not getattr(e, 'readonly', None) or not e.readonly)
+            self.wait_until(lambda e: not e._read_only)
         except TimeoutError:
             self._raise_writable()
 
@@ -689,6 +712,25 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
         """
         return self.el is not None
 
+    @property
+    def _read_only(self):
+        """
+        Reads the readOnly property with a single script call, which is cheaper to poll than
+        reading the attribute through WebDriver
+        """
+        return self._element_call(
+            lambda: self.driver.execute_script('return !!arguments[0].readOnly;', self.el))
+
+    @property
+    def _writable(self):
+        """
+        Checks for an enabled element that is not readonly with a single script call, so an
+        element that is already writable does not need separate enabled and readonly checks
+        """
+        return self._element_call(lambda: self.driver.execute_script(
+            'var e = arguments[0], matches = e.matches || e.msMatchesSelector;'
+            "return !matches.call(e, ':disabled') && !e.readOnly;", self.el))
+
     @property
     def _raise_writable(self):
         raise ObjectReadOnlyException('element present and enabled, but timed out after {} '
@@ -713,13 +755,72 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
         return self.__class__
 
     def _ensure_context(self):
+        if isinstance(self.query_scope, Browser):
+            # switches back to the default content when needed
+            self.query_scope.locate()
+            return
+
         from nerodia.elements.i_frame import IFrame
-        if isinstance(self.query_scope, Browser) or \
-                (self.query_scope._located and self.query_scope.stale):
+        if self.query_scope._located and self.query_scope.stale:
             self.query_scope.locate()
         if isinstance(self.query_scope, IFrame):
             self.query_scope.switch_to()
 
+    @property
+    def _counts_mutations(self):
+        """
+        Returns True if waiting for the element to exist should only locate it again when the DOM
+        has changed since the previous attempt. This only applies to selectors built entirely
+        into XPath; matched values and css pseudo-classes can change without any mutation
+        """
+        return nerodia.mutation_aware_locate and isinstance(self.query_scope, Browser) and \
+            list(self.selector_builder.built) == ['xpath']
+
+    @property
+    def _mutation_aware_check(self):
+        last = {}
+
+        def check(e):
+            self.query_scope.locate()
+            count = self._execute_js('mutationCount')
+            if count is not None and count == last.get('count'):
+                return False
+            last['count'] = count
+            return e.exists
+        return check
+
+    def _stop_counting_mutations(self):
+        try:
+            self.query_scope.locate()
+            self._execute_js('stopMutationCount')
+        except WebDriverException:
+            pass  # must not replace the outcome of the wait; the page may already be gone
+
+    @property
+    def _missing_key(self):
+        return self.selector_string, self.browser.url
+
+    def _recently_missing(self, missing_key):
+        """
+        Returns True if waiting for the element with the given missing key timed out within
+        nerodia.negative_locate_cache_ttl seconds
+        """
+        if missing_key is None or not nerodia.negative_locate_cache_ttl:
+            return False
+        missing_at = self.browser._missing_elements.get(missing_key)
+        return missing_at is not None and \
+            monotonic() - missing_at < nerodia.negative_locate_cache_ttl
+
+    def _remember_missing(self, missing_key):
+        ttl = nerodia.negative_locate_cache_ttl
+        if missing_key is None or not ttl or self._recently_missing(missing_key):
+            return
+        now = monotonic()
+        missing = self.browser._missing_elements
+        for key in [k for k, missing_at in missing.items() if now - missing_at >= ttl]:
+            missing.pop(key)
+        missing[missing_key] = now
+
     def _assert_enabled(self):
         if not self._element_call(lambda: self.el.is_enabled()):
             raise ObjectDisabledException('object is disabled {}'.format(self))
@@ -740,39 +841,49 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
         except StaleElementReferenceException:
             self.reset()
 
-    def _element_call(self, method, precondition=None):
-        caller = stack()[1][3]
-        already_locked = Wait.timer.locked
-        if not already_locked:
-            from ..wait.timer import Timer
-            Wait.timer = Timer(timeout=nerodia.default_timeout)
+    def _perform_actions(self, chain, precondition=None):
+        """
+        Builds an action chain with the given callable and performs it, by default once the
+        element is present
+        """
+        return self._element_call(lambda: chain(ActionChains(self.driver)).perform(),
+                                  precondition or self.wait_for_present,
+                                  caller=currentframe().f_back.f_code.co_name)
+
+    def _element_call(self, method, precondition=None, caller=None):
+        caller = caller or currentframe().f_back.f_code.co_name
+        timer = Wait.timer
+        owned = not timer.locked
+        if owned:
+            if isinstance(timer, Timer):
+                timer.reconfigure(nerodia.default_timeout)
+            else:
+                timer = Wait.timer = Timer(timeout=nerodia.default_timeout)
         try:
             return self._element_call_check(precondition, method, caller)
         finally:
-            nerodia.logger.debug('<- `Completed {}#{}`'.format(self, caller))
-            if not already_locked:
-                Wait.timer.reset()
+            nerodia.logger.debug('<- `Completed %s#%s`', self, caller)
+            if owned:
+                timer.reset()
 
     def _check_condition(self, condition, caller):
-        nerodia.logger.debug('<- `Verifying precondition {}#{} for '
-                             '{}`'.format(self, condition, caller))
+        nerodia.logger.debug('<- `Verifying precondition %s#%s for %s`', self, condition, caller)
         try:
             if not condition:
                 self.assert_exists()
             else:
                 condition()
-            nerodia.logger.debug('<- `Verified precondition '
-                                 '{}#{!r}`'.format(self, condition or 'assert_exists'))
+            nerodia.logger.debug('<- `Verified precondition %s#%r`', self,
+                                 condition or 'assert_exists')
         except self._unknown_exception:
             if condition is None:
-                nerodia.logger.debug('<- `Unable to satisfy precondition '
-                                     '{}#{}`'.format(self, condition))
+                nerodia.logger.debug('<- `Unable to satisfy precondition %s#%s`', self, condition)
                 self._check_condition(self.wait_for_exists, caller)
             else:
                 raise
 
     def _element_call_check(self, precondition, method, caller):
-        nerodia.logger.debug('-> `Executing {}#{}`'.format(self, caller))
+        nerodia.logger.debug('-> `Executing %s#%s`', self, caller)
         while True:
             try:
                 self._check_condition(precondition, caller)
@@ -810,7 +921,8 @@ class Element(ClassHelpers, JSExecution, Container, JSSnippet, Waitable, Adjacen
                 raise NoMatchingWindowFoundException('browser window was closed')
 
     def __getattribute__(self, name):
-        if search(SelectorBuilder.WILDCARD_ATTRIBUTE, name):
+        # every attribute lookup passes through here, so check the prefix before the pattern
+        if name[:5] in ('aria_', 'data_') and SelectorBuilder.WILDCARD_ATTRIBUTE.search(name):
             return self.attribute_value(name.replace('_', '-'))
         else:
             return object.__getattribute__(self, name)
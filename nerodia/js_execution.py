@@ -1,10 +1,14 @@
-import re
 from time import sleep
 
+from selenium.common.exceptions import TimeoutException
+
 import nerodia
 
 
 class JSExecution(object):
+    # longest time in seconds a single script may spend flashing an element
+    FLASH_BATCH_TIME = 2
+
     def execute_script(self, script, *args):
         """
         Delegates script execution to Browser or IFrame
@@ -26,7 +30,9 @@ class JSExecution(object):
         browser.button(name: 'new_user_button').fire_event('mousemove')
         browser.button(name: 'new_user_button').fire_event('onmouseover')
         """
-        event_name = re.sub(r'^on', '', event_name).lower()
+        if event_name.startswith('on'):
+            event_name = event_name[2:]
+        event_name = event_name.lower()
         return self._element_call(lambda: self._execute_js('fireEvent', self, event_name))
 
     def flash(self, preset='default', color='red', flashes=10, delay=0.05):
@@ -81,10 +87,15 @@ class JSExecution(object):
             colors = color[:]
         colors.append(background_color)
 
-        for next_color in colors * flashes:
+        steps = colors * flashes
+        if delay < self.FLASH_BATCH_TIME:
+            steps = self._flash_in_batches(steps, delay, original_color)
+            if not steps:
+                return self
+
+        for next_color in steps:
             self._element_call(lambda: self._execute_js('backgroundColor', self.el, next_color))
             sleep(delay)
-
         self._element_call(lambda: self._execute_js('backgroundColor', self.el, original_color))
 
         return self
@@ -176,3 +187,23 @@ class JSExecution(object):
         browser.li(id='non_link_1').selected_text
         """
         return self._element_call(lambda: self._execute_js('selectedText'))
+
+    # private
+
+    def _flash_in_batches(self, steps, delay, original_color):
+        """
+        Runs the flash steps in async scripts that each finish well within the script timeout
+        Returns the steps left to run one at a time if the driver times out the script
+        """
+        size = max(1, int(self.FLASH_BATCH_TIME / delay) if delay else len(steps))
+        for start in range(0, len(steps), size):
+            batch = steps[start:start + size]
+            last = start + size >= len(steps)
+            try:
+                self._element_call(lambda: self._execute_async_js(
+                    'flash', self.el, batch, int(delay * 1000), original_color, last))
+            except TimeoutException:
+                # e.g. legacy drivers default the async script timeout to 0
+                self._element_call(lambda: self._execute_js('stopFlash', self.el))
+                return steps[start:]
+        return []
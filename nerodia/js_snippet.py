@@ -5,6 +5,13 @@ class JSSnippet(object):
     # private
 
     def _execute_js(self, function_name, *args):
+        return self.query_scope.execute_script(self._js_snippet(function_name), *args)
+
+    def _execute_async_js(self, function_name, *args):
+        return self.query_scope.driver.execute_async_script(self._js_snippet(function_name), *args)
+
+    @staticmethod
+    def _js_snippet(function_name):
         filepath = path.abspath(path.join(path.dirname(__file__),
                                           'js_snippets',
                                           '{}.js'.format(function_name)))
@@ -13,5 +20,4 @@ class JSSnippet(object):
             raise Error('Can not excute script as {!r} does not exist'.format(filepath))
 
         with open(filepath, 'r') as myfile:
-            script = 'return ({}).apply(null, arguments)'.format(myfile.read())
-            return self.query_scope.execute_script(script, *args)
+            return 'return ({}).apply(null, arguments)'.format(myfile.read())
@@ -0,0 +1,20 @@
+function(){
+    var element = arguments[0], colors = arguments[1], delay = arguments[2],
+        original = arguments[3], restore = arguments[4], done = arguments[arguments.length - 1],
+        index = 0, token = {};
+    element.__nerodiaFlash = token;
+    (function next() {
+        if (element.__nerodiaFlash !== token) {
+            return;
+        }
+        if (index < colors.length) {
+            element.style.backgroundColor = colors[index++];
+            setTimeout(next, delay);
+        } else {
+            if (restore) {
+                element.style.backgroundColor = original;
+            }
+            done();
+        }
+    })();
+}
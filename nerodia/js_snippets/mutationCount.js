@@ -0,0 +1,12 @@
+function(){
+    if (typeof window.__nerodiaMutationCount == "undefined") {
+        window.__nerodiaMutationCount = 0;
+        window.__nerodiaMutationObserver = new MutationObserver(function(mutations) {
+            window.__nerodiaMutationCount += mutations.length;
+        });
+        window.__nerodiaMutationObserver.observe(document, {attributes: true, characterData: true,
+                                                            childList: true, subtree: true});
+        return null;
+    }
+    return window.__nerodiaMutationCount;
+}
@@ -0,0 +1,3 @@
+function(){
+    arguments[0].__nerodiaFlash = null;
+}
@@ -0,0 +1,7 @@
+function(){
+    if (window.__nerodiaMutationObserver) {
+        window.__nerodiaMutationObserver.disconnect();
+    }
+    delete window.__nerodiaMutationObserver;
+    delete window.__nerodiaMutationCount;
+}
@@ -1,6 +1,9 @@
 from copy import copy
 from importlib import import_module
 
+# locator module resolved for each (locator namespace, element class name)
+_locator_modules = {}
+
 
 class ClassHelpers(object):
 
@@ -40,12 +43,20 @@ class ClassHelpers(object):
 
     @property
     def _import_module(self):
-        from ..module_mapping import map_module
-        modules = [self.browser.locator_namespace.__name__, map_module(self._element_class_name)]
-        try:
-            return import_module('{}.{}'.format(*modules))
-        except ImportError:
-            return import_module('{}.element'.format(*modules[:1]))
+        key = (self.browser.locator_namespace.__name__, self._element_class_name)
+        module = _locator_modules.get(key)
+        if module is None:
+            from ..module_mapping import map_module
+            name = '{}.{}'.format(key[0], map_module(key[1]))
+            try:
+                module = import_module(name)
+            except ImportError as e:
+                # only fall back when the module itself is missing, not when importing it failed
+                if getattr(e, 'name', None) not in (None, name):
+                    raise
+                module = import_module('{}.element'.format(key[0]))
+            _locator_modules[key] = module
+        return module
 
     @property
     def _element_class_name(self):
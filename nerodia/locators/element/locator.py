@@ -44,13 +44,13 @@ class Locator(object):
     @property
     def _matching_elements(self):
         if len(self.built) == 1 and self.filter == 'first':
-            return self._locate_element(*list(ClassHelpers._flatten(self.built.items())))
+            return self._locate_element(*next(iter(self.built.items())))
 
         retries = 0
         while retries <= 2:
             try:
-                locator = list(ClassHelpers._flatten(self._wd_locator.items()))
-                elements = self._locate_elements(*locator)
+                how, what = next(iter(self._wd_locator.items()))
+                elements = self._locate_elements(how, what)
 
                 return self.element_matcher.match(elements, self._match_values, self.filter)
             except StaleElementReferenceException:
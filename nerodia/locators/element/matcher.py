@@ -58,14 +58,14 @@ class Matcher(object):
                     matches.append(element)
             try:
                 val = list(islice(matches, idx + 1))[idx]
-                nerodia.logger.debug('Iterated through {} elements to locate '
-                                     '{}'.format(counter, self.selector))
+                nerodia.logger.debug('Iterated through %s elements to locate %s', counter,
+                                     self.selector)
                 return val
             except IndexError:
                 return None
         else:
-            nerodia.logger.debug('Iterated through {} elements to locate all '
-                                 '{}'.format(len(elements), self.selector))
+            nerodia.logger.debug('Iterated through %s elements to locate all %s', len(elements),
+                                 self.selector)
             return [el for el in elements if self._elements_match(el, values_to_match)]
 
     def _elements_match(self, element, values_to_match):
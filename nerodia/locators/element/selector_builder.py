@@ -1,3 +1,4 @@
+import logging
 import re
 from collections import defaultdict
 from importlib import import_module
@@ -31,10 +32,15 @@ WHATS = {
     'text': STRING_REGEX_TYPES
 }
 
+CACHEABLE_TYPES = tuple(STRING_TYPES) + (int, float, bool, type(None))
+
 
 class SelectorBuilder(object):
     WILDCARD_ATTRIBUTE = re.compile(r'^(aria|data)_(.+)$')
     VALID_WHATS = defaultdict(lambda: STRING_REGEX_TYPES + [bool], WHATS)
+    BUILD_CACHE_SIZE = 512
+
+    _build_cache = {}
 
     xpath_builder = None
     selector = None
@@ -49,7 +55,8 @@ class SelectorBuilder(object):
         self.selector = selector
         self._deprecated_locators()
         self._normalize_selector()
-        rep = repr(selector)
+        # the selector can be changed while building, so take its repr up front when logging
+        rep = repr(selector) if nerodia.logger.isEnabledFor(logging.INFO) else None
         from nerodia.browser import Browser
         scope = None
         if 'scope' not in self.selector and not isinstance(self.query_scope, Browser):
@@ -63,7 +70,8 @@ class SelectorBuilder(object):
         if scope is not None:
             self.built['scope'] = scope
 
-        nerodia.logger.info('Converted {} to {}'.format(rep, self.built))
+        if rep is not None:
+            nerodia.logger.info('Converted %s to %s', rep, self.built)
 
         return self.built
 
@@ -179,7 +187,41 @@ class SelectorBuilder(object):
         return xpath
 
     def _build_wd_selector(self, selector):
-        return self._implementation_class().build(selector)
+        implementation = self._implementation_class
+        key = self._build_cache_key(implementation, selector)
+        if key is None:
+            return implementation().build(selector)
+
+        built = self._build_cache.get(key)
+        if built is None:
+            built = implementation().build(selector)
+            if len(self._build_cache) >= self.BUILD_CACHE_SIZE:
+                self._build_cache.clear()
+            self._build_cache[key] = built
+        # copy so callers can not alter the cached result
+        return {k: list(v) if isinstance(v, list) else v for k, v in built.items()}
+
+    @staticmethod
+    def _build_cache_key(implementation, selector):
+        """
+        Returns a hashable key for the selector or None if it contains values that can not be
+        safely cached (e.g. element references)
+        """
+        def freeze(value):
+            if isinstance(value, dict):
+                return frozenset((k, freeze(v)) for k, v in value.items())
+            elif isinstance(value, (list, tuple)):
+                return tuple(freeze(v) for v in value)
+            elif isinstance(value, Pattern):
+                return Pattern, value.pattern, value.flags
+            elif isinstance(value, CACHEABLE_TYPES):
+                return value.__class__, value
+            raise TypeError
+
+        try:
+            return implementation, freeze(selector)
+        except TypeError:
+            return None
 
     @property
     def _wd_locator(self):
@@ -244,14 +286,15 @@ class XPath(object):
         self.adjacent = self.selector.pop('adjacent', None)
         self.scope = self.selector.pop('scope', None)
 
-        xpath = self._start_string
-        xpath += self._adjacent_string
-        xpath += self._tag_string
-        xpath += self._class_string
-        xpath += self._text_string
-        xpath += self._additional_string
-        xpath += self._label_element_string
-        xpath += self._attribute_string
+        # the parts consume keys from the selector, so they must be evaluated in this order
+        xpath = ''.join([self._start_string,
+                         self._adjacent_string,
+                         self._tag_string,
+                         self._class_string,
+                         self._text_string,
+                         self._additional_string,
+                         self._label_element_string,
+                         self._attribute_string])
 
         self.built['xpath'] = self._add_index(xpath, index) if index is not None else xpath
 
@@ -7,7 +7,7 @@ from ..element.selector_builder import SelectorBuilder as ElementSelectorBuilder
 class SelectorBuilder(ElementSelectorBuilder):
 
     def _build_wd_selector(self, selector):
-        scope_tag_name = self.query_scope.selector.get('tag_name', self.query_scope.tag_name)
+        scope_tag_name = self.query_scope.selector.get('tag_name') or self.query_scope.tag_name
         try:
             mod = import_module(self.__module__)
             xpath = getattr(mod, 'XPath', XPath)
@@ -21,6 +21,12 @@ class SelectorBuilder(ElementSelectorBuilder):
 
 
 class XPath(ElementXPath):
+    SECTION_TAGS = frozenset(['tbody', 'tfoot', 'thead'])
+    SECTION_EXPRESSIONS = ("./*[local-name()='tr']",)
+    TABLE_EXPRESSIONS = ("./*[local-name()='tr']",
+                         "./*[local-name()='tbody']/*[local-name()='tr']",
+                         "./*[local-name()='thead']/*[local-name()='tr']",
+                         "./*[local-name()='tfoot']/*[local-name()='tr']")
 
     def build(self, selector, scope_tag_name):
         if 'adjacent' in selector:
@@ -58,10 +64,7 @@ class XPath(ElementXPath):
         return ''
 
     def _generate_expressions(self, scope_tag_name):
-        if scope_tag_name in ['tbody', 'tfoot', 'thead']:
-            return ["./*[local-name()='tr']"]
+        if scope_tag_name in self.SECTION_TAGS:
+            return self.SECTION_EXPRESSIONS
         else:
-            return ["./*[local-name()='tr']",
-                    "./*[local-name()='tbody']/*[local-name()='tr']",
-                    "./*[local-name()='thead']/*[local-name()='tr']",
-                    "./*[local-name()='tfoot']/*[local-name()='tr']"]
+            return self.TABLE_EXPRESSIONS
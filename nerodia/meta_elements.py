@@ -22,7 +22,7 @@ class MetaSVGElement(type):
 def create_attributes(name, parents, dct, generated):
     final_dict = {}
 
-    attrs = dct.get('ATTRIBUTES', [])
+    attrs = list(dct.get('ATTRIBUTES', []))
     for key, value in dct.items():
         if key.startswith('_attr'):
             attr_name = key.split('_attr_')[-1]
@@ -42,7 +42,7 @@ def create_attributes(name, parents, dct, generated):
     for parent in parents:
         attrs.extend(getattr(parent, 'ATTRIBUTES', []))
 
-    final_dict['ATTRIBUTES'] = list(set(attrs))
+    final_dict['ATTRIBUTES'] = frozenset(attrs)
     return final_dict
 
 
@@ -1,8 +1,20 @@
-from time import sleep, time
+from time import sleep
+
+try:
+    from time import monotonic
+except ImportError:
+    from time import time as monotonic
 
 
 class Timer(object):
     def __init__(self, timeout=None):
+        self.reconfigure(timeout)
+
+    def reconfigure(self, timeout=None):
+        """
+        Restarts the timer in place with the given timeout
+        :param timeout: time in seconds to timeout after
+        """
         self.end_time = self._current_time() + timeout if timeout else None
 
     def wait(self, timeout, method, interval=0, object=None, expected=True):
@@ -42,4 +54,4 @@ class Timer(object):
     # private
 
     def _current_time(self):
-        return time()
+        return monotonic()
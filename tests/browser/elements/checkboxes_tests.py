@@ -17,12 +17,15 @@ def test_returns_the_button_at_the_given_index(browser):
 
 def test_iterates_through_buttons_correctly(browser):
     from nerodia.elements.check_box import CheckBox
-    count = 0
-    for index, c in enumerate(browser.checkboxes()):
-        checkbox = browser.checkbox(index=index)
-        assert isinstance(checkbox, CheckBox)
-        assert c.name == checkbox.name
-        assert c.id == checkbox.id
-        assert c.value == checkbox.value
-        count += 1
-    assert count > 0
+    names, ids, values = browser.execute_script(
+        "var cs = document.querySelectorAll('input[type=checkbox]'), map = Array.prototype.map;"
+        "return [map.call(cs, function(c) { return c.name; }),"
+        "        map.call(cs, function(c) { return c.id; }),"
+        "        map.call(cs, function(c) { return c.value; })];")
+    checkboxes = list(browser.checkboxes())
+    assert len(ids) > 0
+    assert len(checkboxes) == len(ids)
+    for index, (c, expected) in enumerate(zip(checkboxes, zip(names, ids, values))):
+        assert isinstance(c, CheckBox)
+        assert (c.name, c.id, c.value) == expected
+        assert browser.checkbox(index=index) == c
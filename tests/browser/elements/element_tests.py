@@ -475,6 +475,15 @@ class TestElementFlash(object):
         assert h1.flash('fast') == h1
         assert h2.flash('long') == h2
 
+    def test_should_flash_longer_than_a_single_script_may_run(self, browser, monkeypatch):
+        from nerodia.js_execution import JSExecution
+        monkeypatch.setattr(JSExecution, 'FLASH_BATCH_TIME', 0.2)
+        h2 = browser.h2(text='Add user')
+        color = h2.style('background-color')
+
+        assert h2.flash(flashes=3, delay=0.05) == h2
+        assert h2.style('background-color') == color
+
 
 @pytest.mark.page('hover.html')
 class TestElementHover(object):
@@ -1,10 +1,26 @@
 from re import compile
-from time import time
 
 import pytest
 
 import nerodia
 from nerodia.exception import UnknownObjectException
+from nerodia.wait.timer import monotonic
+
+NOT_THERE_PATTERN = compile(r'not|there')
+
+
+@pytest.fixture
+def mutation_aware_locate():
+    nerodia.mutation_aware_locate = True
+    yield
+    nerodia.mutation_aware_locate = False
+
+
+@pytest.fixture
+def negative_locate_cache():
+    nerodia.negative_locate_cache_ttl = 10
+    yield
+    nerodia.negative_locate_cache_ttl = None
 
 
 @pytest.mark.page('wait.html')
@@ -12,84 +28,117 @@ from nerodia.exception import UnknownObjectException
 @pytest.mark.skipif('nerodia.relaxed_locate is False',
                     reason='only applicable when relaxed locating')
 class TestRelaxedLocate(object):
+    @pytest.mark.parametrize('timeout_reset', [2], indirect=True)
     def test_raises_exception_after_timing_out_on_element_never_present(self, browser):
-        timeout = 2
-        nerodia.default_timeout = timeout
         with pytest.raises(UnknownObjectException):
             element = browser.link(id='not_there')
-            start = time()
+            start = monotonic()
             element.click()
-        assert time() - start > timeout
+        assert monotonic() - start > nerodia.default_timeout
 
+    @pytest.mark.parametrize('timeout_reset', [2], indirect=True)
     def test_raises_exception_after_timing_out_on_element_parent_never_present(self, browser):
-        timeout = 2
-        nerodia.default_timeout = timeout
         with pytest.raises(UnknownObjectException):
             element = browser.link(id='not_there')
-            start = time()
+            start = monotonic()
             element.element().click()
-        assert time() - start > timeout
+        assert monotonic() - start > nerodia.default_timeout
 
+    @pytest.mark.parametrize('timeout_reset', [2], indirect=True)
     def test_raises_exception_after_timing_out_on_element_from_collection_parent_never_present(self, browser):
-        timeout = 2
-        nerodia.default_timeout = timeout
         with pytest.raises(UnknownObjectException):
             element = browser.link(id='not_there')
-            start = time()
+            start = monotonic()
             element.elements()[2].click()
-        assert time() - start > timeout
+        assert monotonic() - start > nerodia.default_timeout
 
+    @pytest.mark.parametrize('timeout_reset', [5], indirect=True)
     def test_does_not_wait_on_element_that_is_already_present(self, browser):
-        nerodia.default_timeout = 5
         element = browser.link()
-        start = time()
+        start = monotonic()
         element.click()
-        assert time() - start < 5
+        assert monotonic() - start < nerodia.default_timeout
 
+    @pytest.mark.parametrize('timeout_reset', [3], indirect=True)
     def test_waits_until_present_present_and_takes_action_on_element_eventually_present(self, browser):
-        nerodia.default_timeout = 3
         element = browser.link(id='show_bar')
-        start = time()
+        start = monotonic()
         element.click()
-        assert time() - start < 3
+        assert monotonic() - start < nerodia.default_timeout
 
     def test_waits_to_not_be_readonly(self, browser):
         assert browser.text_field(id='writable').readonly is True
-        start_time = time()
+        start_time = monotonic()
         browser.link(id='make-writable').click()
         browser.text_field(id='writable').set('foo')
-        assert time() - start_time > 2
+        assert monotonic() - start_time > 2
 
+    @pytest.mark.parametrize('timeout_reset', [-1], indirect=True)
     def test_ensures_all_checks_happen_once_even_if_time_has_expired(self, browser):
-        nerodia.default_timeout = -1
         browser.link().click()
 
     def test_waits_for_parent_element_to_be_present_before_locating_a_collection(self, browser):
-        els = browser.element(id=compile(r'not|there')).elements(id='doesnt_matter')
+        els = browser.element(id=NOT_THERE_PATTERN).elements(id='doesnt_matter')
         with pytest.raises(UnknownObjectException):
             list(els)
 
+    @pytest.mark.usefixtures('mutation_aware_locate')
+    @pytest.mark.parametrize('timeout_reset', [2], indirect=True)
+    def test_raises_exception_after_timing_out_when_mutation_aware(self, browser):
+        with pytest.raises(UnknownObjectException):
+            element = browser.link(id='not_there')
+            start = monotonic()
+            element.click()
+        assert monotonic() - start > nerodia.default_timeout
+
+    @pytest.mark.usefixtures('mutation_aware_locate')
+    @pytest.mark.parametrize('timeout_reset', [3], indirect=True)
+    def test_locates_element_added_to_the_dom_when_mutation_aware(self, browser):
+        browser.link(id='readd_bar').click()
+        browser.div(id='bar').wait_for_exists()
+        assert browser.div(id='bar').exists
+        assert browser.execute_script('return typeof window.__nerodiaMutationObserver') == \
+            'undefined'
+
+    @pytest.mark.usefixtures('mutation_aware_locate')
+    @pytest.mark.parametrize('timeout_reset', [3], indirect=True)
+    def test_locates_element_matched_by_typed_text_when_mutation_aware(self, browser):
+        browser.execute_script("var input = document.createElement('input');"
+                               "document.body.appendChild(input);"
+                               "setTimeout(function() { input.value = 'typed'; }, 500);")
+        browser.text_field(text='typed').wait_for_exists()
+        assert browser.text_field(text='typed').exists
+
+    @pytest.mark.usefixtures('negative_locate_cache')
+    @pytest.mark.parametrize('timeout_reset', [2], indirect=True)
+    def test_raises_immediately_on_element_recently_timed_out(self, browser):
+        with pytest.raises(UnknownObjectException):
+            browser.link(id='not_there').click()
+        with pytest.raises(UnknownObjectException):
+            start = monotonic()
+            browser.link(id='not_there').click()
+        assert monotonic() - start < nerodia.default_timeout
+
 
 @pytest.mark.page('wait.html')
 @pytest.mark.usefixtures('timeout_reset')
 @pytest.mark.skipif('nerodia.relaxed_locate',
                     reason='only applicable when not relaxed locating')
 class TestNotRelaxedLocate(object):
+    @pytest.mark.parametrize('timeout_reset', [2], indirect=True)
     def test_raises_exception_immediately_on_element_never_present(self, browser):
-        timeout = 2
-        nerodia.default_timeout = timeout
         element = browser.link(id='not_there')
         with pytest.raises(UnknownObjectException):
-            start = time()
+            start = monotonic()
             element.click()
-        assert time() - start < 1
+        assert monotonic() - start < 1
 
+    @pytest.mark.parametrize('timeout_reset', [3], indirect=True)
     def test_raises_exception_immediately_on_element_eventually_present(self, browser):
         from selenium.common.exceptions import ElementNotInteractableException, \
             ElementNotVisibleException
         err = ElementNotInteractableException if browser.name == 'firefox' \
             else ElementNotVisibleException
-        nerodia.default_timeout = 3
         browser.link(id='show_bar').click()
         with pytest.raises(err):
             browser.div(id='bar').click()
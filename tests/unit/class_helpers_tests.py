@@ -0,0 +1,53 @@
+import pytest
+
+from nerodia.locators.class_helpers import ClassHelpers
+
+
+class Foo(object):
+    pass
+
+
+def import_error(name):
+    error = ImportError('No module named {!r}'.format(name))
+    error.name = name
+    return error
+
+
+class Helper(ClassHelpers):
+    def __init__(self, browser):
+        self.browser = browser
+
+    @property
+    def _element_class(self):
+        return Foo
+
+
+@pytest.fixture
+def helper(mocker):
+    mocker.patch.dict('nerodia.locators.class_helpers._locator_modules', clear=True)
+    browser = mocker.MagicMock()
+    browser.locator_namespace.__name__ = 'namespace'
+    yield Helper(browser)
+
+
+class TestClassHelpersImportModule(object):
+    def test_falls_back_to_element_module_when_specific_module_is_missing(self, mocker, helper):
+        element_module = object()
+
+        def import_module(name):
+            if name == 'namespace.foo':
+                raise import_error(name)
+            return element_module
+        mocker.patch('nerodia.locators.class_helpers.import_module', side_effect=import_module)
+
+        assert helper._import_module is element_module
+
+    def test_raises_import_errors_from_inside_specific_module(self, mocker, helper):
+        def import_module(name):
+            if name == 'namespace.foo':
+                raise import_error('missing')
+            return object()
+        mocker.patch('nerodia.locators.class_helpers.import_module', side_effect=import_module)
+
+        with pytest.raises(ImportError):
+            helper._import_module
@@ -696,3 +696,19 @@ class TestBuild(object):
         build_selector = builder.build(selector)
         assert build_selector.pop('scope', None) is not None
         assert build_selector == built
+
+    # with cached builds
+
+    def test_returns_equal_results_for_repeated_selectors(self, builder):
+        selector = {'tag_name': 'div', 'class': compile(r'he?r')}
+        first = builder.build(selector.copy())
+        second = builder.build(selector.copy())
+        assert first == second
+        assert first is not second
+        assert first['class'] is not second['class']
+
+    def test_does_not_share_results_between_selectors(self, builder):
+        assert builder.build({'tag_name': 'div', 'index': 1}) == \
+            {'xpath': "(.//*[local-name()='div'])[2]"}
+        assert builder.build({'tag_name': 'div', 'index': 2}) == \
+            {'xpath': "(.//*[local-name()='div'])[3]"}
@@ -8,20 +8,13 @@ from nerodia.locators.element.xpath_support import XpathSupport
 from nerodia.locators.text_field.selector_builder import SelectorBuilder
 
 ATTRIBUTES = HTMLElement.ATTRIBUTES
-NEGATIVE_TYPES = ' and '.join([
-    "translate(@type,'{}','{}')!='file'".format(XpathSupport.UPPERCASE, XpathSupport.LOWERCASE),
-    "translate(@type,'{}','{}')!='radio'".format(XpathSupport.UPPERCASE, XpathSupport.LOWERCASE),
-    "translate(@type,'{}','{}')!='checkbox'".format(XpathSupport.UPPERCASE, XpathSupport.LOWERCASE),
-    "translate(@type,'{}','{}')!='submit'".format(XpathSupport.UPPERCASE, XpathSupport.LOWERCASE),
-    "translate(@type,'{}','{}')!='reset'".format(XpathSupport.UPPERCASE, XpathSupport.LOWERCASE),
-    "translate(@type,'{}','{}')!='image'".format(XpathSupport.UPPERCASE, XpathSupport.LOWERCASE),
-    "translate(@type,'{}','{}')!='button'".format(XpathSupport.UPPERCASE, XpathSupport.LOWERCASE),
-    "translate(@type,'{}','{}')!='hidden'".format(XpathSupport.UPPERCASE, XpathSupport.LOWERCASE),
-    "translate(@type,'{}','{}')!='range'".format(XpathSupport.UPPERCASE, XpathSupport.LOWERCASE),
-    "translate(@type,'{}','{}')!='color'".format(XpathSupport.UPPERCASE, XpathSupport.LOWERCASE),
-    "translate(@type,'{}','{}')!='date'".format(XpathSupport.UPPERCASE, XpathSupport.LOWERCASE),
-    "translate(@type,'{}','{}')!='datetime-local'".format(XpathSupport.UPPERCASE, XpathSupport.LOWERCASE)
-])
+NON_TEXT_TYPES = ('file', 'radio', 'checkbox', 'submit', 'reset', 'image', 'button', 'hidden',
+                  'range', 'color', 'date', 'datetime-local')
+NEGATIVE_TYPES = "not(contains(' {} ', concat(' ', translate(@type,'{}','{}'), ' ')))".format(
+    ' '.join(NON_TEXT_TYPES), XpathSupport.UPPERCASE, XpathSupport.LOWERCASE)
+NEGATIVE_TYPES_CSS = ''.join(':not([type={}])'.format(typ) for typ in NON_TEXT_TYPES)
+DEV_PATTERN = compile(r'Dev')
+FOO_PATTERN = compile(r'^foo$')
 
 
 @pytest.fixture
@@ -33,8 +26,7 @@ class TestBuild(object):
     def test_without_any_elements(self, builder):
         items = {
             'selector': {},
-            'built': {'xpath': ".//*[local-name()='input'][not(@type) or "
-                               "({})]".format(NEGATIVE_TYPES)}
+            'built': {'css': 'input{}'.format(NEGATIVE_TYPES_CSS)}
         }
         assert builder.build(items['selector']) == items['built']
 
@@ -59,7 +51,14 @@ class TestBuild(object):
     def test_true_locates_text_field_with_a_type_specified(self, builder):
         items = {
             'selector': {'type': True},
-            'built': {'xpath': ".//*[local-name()='input'][{}]".format(NEGATIVE_TYPES)}
+            'built': {'css': 'input[type]{}'.format(NEGATIVE_TYPES_CSS)}
+        }
+        assert builder.build(items['selector']) == items['built']
+
+    def test_true_with_other_attributes_uses_xpath(self, builder):
+        items = {
+            'selector': {'type': True, 'name': 'user'},
+            'built': {'xpath': ".//*[local-name()='input'][{}][@name='user']".format(NEGATIVE_TYPES)}
         }
         assert builder.build(items['selector']) == items['built']
 
@@ -128,19 +127,19 @@ class TestBuild(object):
 
     def test_simple_regexp_for_value(self, builder):
         items = {
-            'selector': {'text': compile(r'Dev')},
+            'selector': {'text': DEV_PATTERN},
             'built': {'xpath': ".//*[local-name()='input'][not(@type) or "
                                "({})]".format(NEGATIVE_TYPES),
-                      'text': compile(r'Dev')},
+                      'text': DEV_PATTERN},
         }
         assert builder.build(items['selector']) == items['built']
 
     def test_returns_complicated_regexp_to_the_locator_as_a_value(self, builder):
         items = {
-            'selector': {'text': compile(r'^foo$')},
+            'selector': {'text': FOO_PATTERN},
             'built': {'xpath': ".//*[local-name()='input'][not(@type) or "
                                "({})]".format(NEGATIVE_TYPES),
-                      'text': compile(r'^foo$')},
+                      'text': FOO_PATTERN},
         }
         assert builder.build(items['selector']) == items['built']
 
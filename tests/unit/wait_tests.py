@@ -93,3 +93,30 @@ class TestWaitDefaultTimer(object):
             assert Wait.timer == timer
         finally:
             Wait.timer = Timer()
+
+    def test_element_calls_replace_a_custom_timer(self, mocker):
+        from nerodia.elements.element import Element
+
+        class Foo(object):
+            locked = False
+        try:
+            Wait.timer = Foo()
+            element = Element(mocker.MagicMock(), {'element': mocker.MagicMock()})
+            assert element._element_call(lambda: 'called') == 'called'
+            assert isinstance(Wait.timer, Timer)
+            assert not Wait.timer.locked
+        finally:
+            Wait.timer = Timer()
+
+
+class TestTimerReconfigure(object):
+    def test_locks_the_timer_with_a_timeout(self):
+        timer = Timer()
+        timer.reconfigure(5)
+        assert timer.locked
+        assert 0 < timer.remaining_time <= 5
+
+    def test_unlocks_the_timer_without_a_timeout(self):
+        timer = Timer(timeout=5)
+        timer.reconfigure()
+        assert not timer.locked